@@ -1,76 +1,197 @@
+import math
+import pickle
 import random
+import sys
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+
+# Account numbers are 10 digits: [ACC_LOW, ACC_LOW + ACC_SPAN).
+ACC_LOW = 1000000000
+ACC_SPAN = 9000000000
+# Odd, not divisible by 3 or 5, so coprime with ACC_SPAN; multiplying by it
+# permutes the range, which keeps generated numbers unique.
+ACC_MULTIPLIER = 2654435761
+
+# Status codes returned by Account.deposit and Account.withdraw.
+DEPOSIT_OK = 0
+DEPOSIT_INVALID = 1
+WITHDRAW_OK = 0
+WITHDRAW_INSUFFICIENT = 1
+WITHDRAW_INVALID = 2
+# Returned instead when the Account view's account has been closed.
+DEPOSIT_CLOSED = 2
+WITHDRAW_CLOSED = 3
+
+# Largest balance, in cents, that fits the bank's array('q') balance column.
+MAX_CENTS = 2**63 - 1
+
+
+def _to_cents(amount):
+    """
+    Converts a dollar amount to whole cents, or returns None if it is not finite.
+
+    Rounds half up on the amount's decimal form, so 0.015 becomes 2 cents and
+    0.025 becomes 3, as the user would expect from what they typed.
+    """
+    if not math.isfinite(amount):
+        return None
+    return int(Decimal(repr(amount)).scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+class AccountClosedError(LookupError):
+    """Raised when an Account view is read after its account was closed."""
+
 
 class Account:
-    """Represents a bank account."""
+    """
+    A view of one account stored in a Bank.
+
+    The account data lives in the bank's parallel arrays; an Account only
+    records its account number and last known row. Closing an account
+    moves another account into its row, so every access first checks that
+    the row still holds this account number and looks the row up again if
+    it does not.
+    """
 
-    def __init__(self, account_number, name, account_type, balance):
+    __slots__ = ('_bank', '_row', '_number')
+
+    def __init__(self, bank, row, account_number):
         """
-        Initializes an Account object.
+        Initializes an Account view.
 
         Args:
+            bank (Bank): The bank that stores the account.
+            row (int): The account's row in the bank's arrays.
             account_number (int): The account number.
-            name (str): The name of the account holder.
-            account_type (str): The type of account (e.g., 'Savings', 'Checking').
-            balance (float): The initial balance of the account.
         """
-        self.account_number = account_number
-        self.name = name
-        self.account_type = account_type
-        self.balance = balance
+        self._bank = bank
+        self._row = row
+        self._number = account_number
+
+    @property
+    def account_number(self):
+        """int: The account number; fixed for the life of the view."""
+        return self._number
+
+    def _find_row(self):
+        """Returns the account's current row, or None if it has been closed."""
+        numbers = self._bank._numbers
+        row = self._row
+        if row < len(numbers) and numbers[row] == self._number:
+            return row
+        row = self._bank._index.get(self._number)
+        if row is not None:
+            self._row = row
+        return row
+
+    def _current_row(self):
+        """Returns the account's current row, raising AccountClosedError if it is gone."""
+        row = self._find_row()
+        if row is None:
+            raise AccountClosedError(f"Account {self._number} has been closed.")
+        return row
+
+    @property
+    def name(self):
+        """str: The name of the account holder."""
+        return self._bank._names[self._current_row()]
+
+    @property
+    def account_type(self):
+        """str: The type of account (e.g., 'Savings', 'Checking')."""
+        return self._bank._types[self._current_row()]
+
+    @property
+    def balance(self):
+        """int: The current balance of the account, in cents."""
+        return self._bank._balances[self._current_row()]
 
     def deposit(self, amount):
         """
         Deposits a specified amount into the account.
 
         Args:
-            amount (float): The amount to deposit.
+            amount (float): The amount to deposit, in dollars.
 
         Returns:
-            bool: True if the deposit is successful, False otherwise.
-        """
-        if amount > 0:
-            self.balance += amount
-            print(f"\nSuccessfully deposited ${amount:.2f}. New balance: ${self.balance:.2f}")
-            return True
-        else:
-            print("\nInvalid deposit amount. Please enter a positive value.")
-            return False
+            int: DEPOSIT_OK on success, DEPOSIT_CLOSED if the account has
+            been closed, DEPOSIT_INVALID if the amount is not positive, not
+            finite, or would overflow the balance.
+        """
+        row = self._find_row()
+        if row is None:
+            return DEPOSIT_CLOSED
+        cents = _to_cents(amount)
+        balances = self._bank._balances
+        if cents is not None and 0 < cents <= MAX_CENTS - balances[row]:
+            balances[row] += cents
+            self._bank._details[row] = None
+            return DEPOSIT_OK
+        return DEPOSIT_INVALID
 
     def withdraw(self, amount):
         """
         Withdraws a specified amount from the account.
 
         Args:
-            amount (float): The amount to withdraw.
+            amount (float): The amount to withdraw, in dollars.
 
         Returns:
-            bool: True if the withdrawal is successful, False otherwise.
-        """
-        if 0 < amount <= self.balance:
-            self.balance -= amount
-            print(f"\nSuccessfully withdrew ${amount:.2f}. New balance: ${self.balance:.2f}")
-            return True
-        elif amount > self.balance:
-            print("\nInsufficient funds for this withdrawal.")
-            return False
-        else:
-            print("\nInvalid withdrawal amount. Please enter a positive value.")
-            return False
+            int: WITHDRAW_OK on success, WITHDRAW_CLOSED if the account has
+            been closed, WITHDRAW_INSUFFICIENT if the amount exceeds the
+            balance, WITHDRAW_INVALID if it is not positive or not finite.
+        """
+        row = self._find_row()
+        if row is None:
+            return WITHDRAW_CLOSED
+        cents = _to_cents(amount)
+        if cents is None or cents <= 0:
+            return WITHDRAW_INVALID
+        balances = self._bank._balances
+        if cents > balances[row]:
+            return WITHDRAW_INSUFFICIENT
+        balances[row] -= cents
+        self._bank._details[row] = None
+        return WITHDRAW_OK
 
     def get_balance(self):
-        """Returns the current balance of the account."""
-        return self.balance
+        """Returns the current balance of the account, in dollars."""
+        return self._bank._balances[self._current_row()] / 100
+
+    def get_balance_cents(self):
+        """Returns the current balance of the account, in cents."""
+        return self._bank._balances[self._current_row()]
+
+    def __repr__(self):
+        """Returns a short representation of the account for debugging."""
+        row = self._find_row()
+        if row is None:
+            return f"Account({self._number!r}, closed)"
+        return f"Account({self._number!r}, balance={self._bank._balances[row]!r})"
 
     def __str__(self):
         """Returns a string representation of the account details."""
-        return (f"\nAccount Number: {self.account_number}"
-                f"\nHolder Name: {self.name}"
-                f"\nAccount Type: {self.account_type}"
-                f"\nBalance: ${self.balance:.2f}")
+        bank = self._bank
+        row = self._current_row()
+        text = bank._details[row]
+        if text is None:
+            text = bank._details[row] = (
+                f"\nAccount Number: {self._number}"
+                f"\nHolder Name: {bank._names[row]}"
+                f"\nAccount Type: {bank._types[row]}"
+                f"\nBalance: ${bank._balances[row] / 100:.2f}")
+        return text
 
 
 class Bank:
-    """Manages bank operations and a collection of accounts."""
+    """
+    Manages bank operations and a collection of accounts.
+
+    Accounts are stored column-wise: row i of _numbers, _names, _types and
+    _balances together make up one account, and _index maps an account
+    number to its row. Balances are kept as whole cents. _details caches
+    each account's formatted string and is cleared when its balance changes.
+    """
 
     def __init__(self, name):
         """
@@ -80,7 +201,15 @@ class Bank:
             name (str): The name of the bank.
         """
         self.name = name
-        self.accounts = {}
+        self._numbers = []
+        self._names = []
+        self._types = []
+        self._balances = array('q')
+        self._details = []
+        self._index = {}
+        # A slight modulo bias in the seeds is harmless for account numbers.
+        self._next_acc = random.getrandbits(34) % ACC_SPAN
+        self._salt = random.getrandbits(34) % ACC_SPAN
 
     def create_account(self, name, account_type, initial_deposit):
         """
@@ -89,7 +218,7 @@ class Bank:
         Args:
             name (str): The name of the account holder.
             account_type (str): The type of account.
-            initial_deposit (float): The initial deposit amount.
+            initial_deposit (float): The initial deposit amount, in dollars.
 
         Returns:
             Account: The newly created Account object, or None if creation failed.
@@ -97,19 +226,41 @@ class Bank:
         if initial_deposit < 0:
             print("\nInitial deposit cannot be negative.")
             return None
+        initial_cents = _to_cents(initial_deposit)
+        if initial_cents is None:
+            print("\nInitial deposit must be a finite amount.")
+            return None
+        if initial_cents > MAX_CENTS:
+            print("\nInitial deposit is too large.")
+            return None
 
+        # Only a handful of distinct types exist, so share one string object each
+        account_type = sys.intern(account_type)
         account_number = self._generate_account_number()
-        new_account = Account(account_number, name, account_type, initial_deposit)
-        self.accounts[account_number] = new_account
+        row = len(self._numbers)
+        # Every value is prepared and validated above, so none of these
+        # appends can fail and leave the columns with different lengths
+        self._numbers.append(account_number)
+        self._names.append(name)
+        self._types.append(account_type)
+        self._balances.append(initial_cents)
+        self._details.append(None)
+        self._index[account_number] = row
+        new_account = Account(self, row, account_number)
         print(f"\nAccount created successfully for {name} with Account Number: {account_number}")
         return new_account
 
     def _generate_account_number(self):
-        """Generates a unique 10-digit account number."""
-        while True:
-            account_number = random.randint(1000000000, 9999999999)
-            if account_number not in self.accounts:
-                return account_number
+        """
+        Generates a unique 10-digit account number.
+
+        A counter seeded at a random offset is scrambled by an affine
+        permutation of the 10-digit range, so no two calls ever return the
+        same number and no index lookup is needed.
+        """
+        n = self._next_acc
+        self._next_acc = (n + 1) % ACC_SPAN
+        return (n * ACC_MULTIPLIER + self._salt) % ACC_SPAN + ACC_LOW
 
     def find_account(self, account_number):
         """
@@ -121,7 +272,10 @@ class Bank:
         Returns:
             Account: The Account object if found, otherwise None.
         """
-        return self.accounts.get(account_number)
+        row = self._index.get(account_number)
+        if row is None:
+            return None
+        return Account(self, row, account_number)
 
     def close_account(self, account_number):
         """
@@ -133,21 +287,92 @@ class Bank:
         Returns:
             bool: True if the account was closed successfully, False otherwise.
         """
-        if account_number in self.accounts:
-            del self.accounts[account_number]
-            print(f"\nAccount {account_number} has been successfully closed.")
-            return True
-        else:
+        row = self._index.pop(account_number, None)
+        if row is None:
             print("\nAccount not found.")
             return False
 
+        self._remove_row(row)
+        print(f"\nAccount {account_number} has been successfully closed.")
+        return True
+
+    def save(self, path):
+        """
+        Saves the bank and all its accounts to a file.
+
+        Args:
+            path (str): The file to write.
+        """
+        state = (self.name, self._next_acc, self._salt,
+                 self._numbers, self._names, self._types,
+                 self._balances.tobytes())
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=5)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a bank previously written by save().
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            Bank: The restored Bank object.
+        """
+        with open(path, 'rb') as f:
+            name, next_acc, salt, numbers, names, types, balances = pickle.load(f)
+
+        bank = cls(name)
+        # The counter state must carry over, or new numbers could repeat old ones
+        bank._next_acc = next_acc
+        bank._salt = salt
+        bank._numbers = numbers
+        bank._names = names
+        bank._types = [sys.intern(account_type) for account_type in types]
+        bank._balances = array('q')
+        bank._balances.frombytes(balances)
+        bank._details = [None] * len(numbers)
+        bank._index = {number: row for row, number in enumerate(numbers)}
+        return bank
+
+    def _remove_row(self, row):
+        """Removes a row by moving the last row into its place."""
+        last = len(self._numbers) - 1
+        if row != last:
+            moved = self._numbers[last]
+            self._numbers[row] = moved
+            self._names[row] = self._names[last]
+            self._types[row] = self._types[last]
+            self._balances[row] = self._balances[last]
+            self._details[row] = self._details[last]
+            self._index[moved] = row
+        self._numbers.pop()
+        self._names.pop()
+        self._types.pop()
+        self._balances.pop()
+        self._details.pop()
+
+    def __len__(self):
+        """Returns the number of accounts in the bank."""
+        return len(self._numbers)
+
+    def __iter__(self):
+        """Yields an Account view for every account in the bank."""
+        for row, account_number in enumerate(self._numbers):
+            yield Account(self, row, account_number)
+
     def list_all_accounts(self):
         """Displays details for all accounts in the bank."""
-        if not self.accounts:
+        if not self._numbers:
             print("\nNo accounts in the bank.")
             return
 
         print("\n--- All Bank Accounts ---")
-        for account in self.accounts.values():
-            print(account)
+        for number, name, account_type, balance in zip(
+                self._numbers, self._names, self._types, self._balances):
+            print(f"\nAccount Number: {number}"
+                  f"\nHolder Name: {name}"
+                  f"\nAccount Type: {account_type}"
+                  f"\nBalance: ${balance / 100:.2f}")
             print("-------------------------")
@@ -1,7 +1,9 @@
 import tkinter as tk
+from enum import IntEnum
+from functools import partial
 from tkinter import ttk  # Import themed widgets
 from tkinter import messagebox  # Import for pop-up dialogs
-from bank_management import Bank, Account  # Import our backend logic
+from bank_management import Bank, Account, DEPOSIT_OK, WITHDRAW_OK, WITHDRAW_INSUFFICIENT  # Import our backend logic
 
 # --- Constants for styling ---
 BG_COLOR = "#F0F4F8"       # Light blue-gray background
@@ -11,6 +13,17 @@ HEADER_FONT = ("Helvetica", 16, "bold")
 LABEL_FONT = ("Helvetica", 10)
 BTN_FONT = ("Helvetica", 10, "bold")
 
+class Page(IntEnum):
+    """Identifiers for the application's pages, used to index BankApp.frames."""
+    START = 0
+    CREATE = 1
+    DEPOSIT = 2
+    WITHDRAW = 3
+    BALANCE = 4
+    DETAILS = 5
+    ALL_ACCOUNTS = 6
+    CLOSE = 7
+
 class BankApp(tk.Tk):
     """Main application class for the Bankify GUI."""
 
@@ -27,30 +40,31 @@ class BankApp(tk.Tk):
         
         # --- Create a container for all frames ---
         # This container will hold all our "pages"
-        container = ttk.Frame(self, padding=(10, 10))
-        container.pack(fill="both", expand=True)
+        self._container = ttk.Frame(self, padding=(10, 10))
+        self._container.pack(fill="both", expand=True)
         
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
-
-        self.frames = {}  # Dictionary to hold all our page frames
+        self._container.grid_rowconfigure(0, weight=1)
+        self._container.grid_columnconfigure(0, weight=1)
 
-        # --- Create and add all pages to the self.frames dictionary ---
-        # We iterate over a tuple of page classes
-        for F in (StartPage, CreateAccountPage, DepositPage, WithdrawPage, 
-                  BalancePage, DetailsPage, AllAccountsPage, CloseAccountPage):
-            page_name = F.__name__
-            frame = F(parent=container, controller=self)
-            self.frames[page_name] = frame
-            # Place all frames in the same grid cell; the one on top will be visible
-            frame.grid(row=0, column=0, sticky="nsew") 
+        # --- Register the page classes, in Page order ---
+        # Pages are only built the first time they are shown
+        self._page_classes = (StartPage, CreateAccountPage, DepositPage, WithdrawPage,
+                              BalancePage, DetailsPage, AllAccountsPage, CloseAccountPage)
+        self.frames = [None] * len(Page)  # The pages built so far, indexed by Page
+        # Shared by every "Back to Menu" button
+        self._back_cmd = partial(self.show_frame, Page.START)
 
         # Show the starting page
-        self.show_frame("StartPage")
-
-    def show_frame(self, page_name):
-        """Raises the given page frame to the top."""
-        frame = self.frames[page_name]
+        self.show_frame(Page.START)
+
+    def show_frame(self, page):
+        """Raises the given page frame to the top, building it on first use."""
+        frame = self.frames[page]
+        if frame is None:
+            frame = self._page_classes[page](parent=self._container, controller=self)
+            self.frames[page] = frame
+            # Place all frames in the same grid cell; the one on top will be visible
+            frame.grid(row=0, column=0, sticky="nsew")
         frame.tkraise()
         # Call 'on_show' method if it exists, to refresh data
         if hasattr(frame, "on_show"):
@@ -84,28 +98,28 @@ class StartPage(ttk.Frame):
         button_grid = ttk.Frame(self)
         button_grid.grid(row=1, column=0)
 
-        # Define button texts and their corresponding page names
+        # Define button texts and their corresponding pages
         buttons = [
-            ("Create Account", "CreateAccountPage"),
-            ("Deposit", "DepositPage"),
-            ("Withdraw", "WithdrawPage"),
-            ("Check Balance", "BalancePage"),
-            ("Account Details", "DetailsPage"),
-            ("List All Accounts", "AllAccountsPage"),
-            ("Close Account", "CloseAccountPage"),
+            ("Create Account", Page.CREATE),
+            ("Deposit", Page.DEPOSIT),
+            ("Withdraw", Page.WITHDRAW),
+            ("Check Balance", Page.BALANCE),
+            ("Account Details", Page.DETAILS),
+            ("List All Accounts", Page.ALL_ACCOUNTS),
+            ("Close Account", Page.CLOSE),
             ("Exit", None) # 'None' for special action (exit)
         ]
 
         # Create and place buttons in a 4x2 grid
         for i, (text, page) in enumerate(buttons):
             row, col = divmod(i, 2)
-            if page:
+            if page is not None:
                 # Standard button that shows a frame
                 btn = ttk.Button(
                     button_grid, 
                     text=text, 
                     width=20,
-                    command=lambda p=page: controller.show_frame(p)
+                    command=partial(controller.show_frame, page)
                 )
             else:
                 # Special case for the Exit button
@@ -113,7 +127,7 @@ class StartPage(ttk.Frame):
                     button_grid, 
                     text=text, 
                     width=20,
-                    command=self.controller.quit # Call the quit method
+                    command=controller.destroy # Close the main window
                 )
             btn.grid(row=row, column=col, padx=10, pady=10)
 
@@ -124,7 +138,7 @@ def create_back_button(parent, controller):
     return ttk.Button(
         parent, 
         text="Back to Menu", 
-        command=lambda: controller.show_frame("StartPage")
+        command=controller._back_cmd
     )
 
 # --- Base Page for common functionality ---
@@ -136,6 +150,17 @@ class BasePage(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.grid_columnconfigure(0, weight=1) # Center content
+        self._last_raw = None # Last account number text that parsed successfully
+        self._last_int = None
+
+    def _parse_acc(self):
+        """Parses the account number entry (raises ValueError), reusing the last result."""
+        raw = self.acc_num_entry.get()
+        if raw == self._last_raw:
+            return self._last_int
+        self._last_int = int(raw)
+        self._last_raw = raw
+        return self._last_int
 
     def create_common_widgets(self, title_text):
         """Creates common widgets like title, account entry, and back button."""
@@ -168,17 +193,18 @@ class CreateAccountPage(ttk.Frame):
         ttk.Label(content_frame, text="Create New Account", font=HEADER_FONT).grid(row=0, column=0, columnspan=2, pady=20)
         
         # --- Entry Fields ---
+        self.name_entry = ttk.Entry(content_frame, width=30)
+        self.type_entry = ttk.Entry(content_frame, width=30)
+        self.deposit_entry = ttk.Entry(content_frame, width=30)
         fields = [
-            ("Holder's Name:", ttk.Entry(content_frame, width=30)),
-            ("Account Type:", ttk.Entry(content_frame, width=30)),
-            ("Initial Deposit:", ttk.Entry(content_frame, width=30))
+            ("Holder's Name:", self.name_entry),
+            ("Account Type:", self.type_entry),
+            ("Initial Deposit:", self.deposit_entry)
         ]
         
-        self.entries = {}
         for i, (text, entry) in enumerate(fields, start=1):
             ttk.Label(content_frame, text=text, font=LABEL_FONT).grid(row=i, column=0, sticky="e", padx=5, pady=5)
             entry.grid(row=i, column=1, sticky="w", padx=5, pady=5)
-            self.entries[text] = entry
             
         # --- Buttons ---
         button_frame = ttk.Frame(content_frame)
@@ -193,9 +219,9 @@ class CreateAccountPage(ttk.Frame):
     def on_create(self):
         """Handles the 'Create Account' button click."""
         try:
-            name = self.entries["Holder's Name:"].get()
-            acc_type = self.entries["Account Type:"].get()
-            deposit = float(self.entries["Initial Deposit:"].get())
+            name = self.name_entry.get()
+            acc_type = self.type_entry.get()
+            deposit = float(self.deposit_entry.get())
             
             if not name or not acc_type:
                 messagebox.showerror("Error", "Name and Account Type cannot be empty.")
@@ -209,11 +235,11 @@ class CreateAccountPage(ttk.Frame):
                     f"Account created for {name}!\nAccount Number: {new_account.account_number}"
                 )
                 # Clear fields after success
-                for entry in self.entries.values():
+                for entry in (self.name_entry, self.type_entry, self.deposit_entry):
                     entry.delete(0, 'end')
-                self.controller.show_frame("StartPage")
+                self.controller.show_frame(Page.START)
             else:
-                messagebox.showerror("Error", "Initial deposit must be $0 or more.")
+                messagebox.showerror("Error", "Initial deposit must be $0 or more and not too large.")
         
         except ValueError:
             messagebox.showerror("Error", "Invalid input for deposit. Please enter a number.")
@@ -239,7 +265,7 @@ class DepositPage(BasePage):
         
     def on_deposit(self):
         try:
-            acc_num = int(self.acc_num_entry.get())
+            acc_num = self._parse_acc()
             amount = float(self.amount_entry.get())
             
             account = self.controller.bank.find_account(acc_num)
@@ -248,13 +274,16 @@ class DepositPage(BasePage):
                 messagebox.showerror("Error", "Account not found.")
                 return
             
-            if account.deposit(amount):
-                messagebox.showinfo("Success", f"Deposited ${amount:.2f}.\nNew Balance: ${account.get_balance():.2f}")
+            before = account.get_balance_cents()
+            if account.deposit(amount) == DEPOSIT_OK:
+                # Report the amount actually credited, after rounding to cents
+                applied = account.get_balance_cents() - before
+                messagebox.showinfo("Success", f"Deposited ${applied / 100:.2f}.\nNew Balance: ${account.get_balance():.2f}")
                 self.acc_num_entry.delete(0, 'end')
                 self.amount_entry.delete(0, 'end')
-                self.controller.show_frame("StartPage")
+                self.controller.show_frame(Page.START)
             else:
-                messagebox.showerror("Error", "Invalid deposit amount. Must be positive.")
+                messagebox.showerror("Error", "Invalid deposit amount. Must be positive and not too large.")
                 
         except ValueError:
             messagebox.showerror("Error", "Invalid input. Please enter numbers.")
@@ -278,7 +307,7 @@ class WithdrawPage(BasePage):
         
     def on_withdraw(self):
         try:
-            acc_num = int(self.acc_num_entry.get())
+            acc_num = self._parse_acc()
             amount = float(self.amount_entry.get())
             
             account = self.controller.bank.find_account(acc_num)
@@ -287,18 +316,19 @@ class WithdrawPage(BasePage):
                 messagebox.showerror("Error", "Account not found.")
                 return
             
-            if account.withdraw(amount):
-                messagebox.showinfo("Success", f"Withdrew ${amount:.2f}.\nNew Balance: ${account.get_balance():.2f}")
+            before = account.get_balance_cents()
+            code = account.withdraw(amount)
+            if code == WITHDRAW_OK:
+                # Report the amount actually debited, after rounding to cents
+                applied = before - account.get_balance_cents()
+                messagebox.showinfo("Success", f"Withdrew ${applied / 100:.2f}.\nNew Balance: ${account.get_balance():.2f}")
                 self.acc_num_entry.delete(0, 'end')
                 self.amount_entry.delete(0, 'end')
-                self.controller.show_frame("StartPage")
+                self.controller.show_frame(Page.START)
+            elif code == WITHDRAW_INSUFFICIENT:
+                messagebox.showerror("Error", "Insufficient funds.")
             else:
-                # The withdraw method prints to console, but we need a GUI message.
-                # The method returns False for *both* insufficient funds and invalid amount.
-                if amount <= 0:
-                     messagebox.showerror("Error", "Invalid withdrawal amount. Must be positive.")
-                else:
-                     messagebox.showerror("Error", "Insufficient funds.")
+                messagebox.showerror("Error", "Invalid withdrawal amount. Must be positive.")
                 
         except ValueError:
             messagebox.showerror("Error", "Invalid input. Please enter numbers.")
@@ -318,7 +348,7 @@ class BalancePage(BasePage):
         
     def on_check(self):
         try:
-            acc_num = int(self.acc_num_entry.get())
+            acc_num = self._parse_acc()
             account = self.controller.bank.find_account(acc_num)
             
             if account:
@@ -345,12 +375,12 @@ class DetailsPage(BasePage):
         
     def on_details(self):
         try:
-            acc_num = int(self.acc_num_entry.get())
+            acc_num = self._parse_acc()
             account = self.controller.bank.find_account(acc_num)
             
             if account:
-                # The __str__ method gives a formatted string
-                details = account.__str__() 
+                # str() gives the (cached) formatted details
+                details = str(account)
                 messagebox.showinfo("Account Details", details)
                 self.acc_num_entry.delete(0, 'end')
             else:
@@ -374,20 +404,20 @@ class AllAccountsPage(ttk.Frame):
         text_frame = ttk.Frame(self, padding=5)
         text_frame.pack(fill="both", expand=True)
         
-        scrollbar = ttk.Scrollbar(text_frame)
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar = ttk.Scrollbar(text_frame)
+        self.scrollbar.pack(side="right", fill="y")
         
         self.text_area = tk.Text(
             text_frame, 
             wrap="word", 
             width=60, 
             height=15,
-            yscrollcommand=scrollbar.set,
+            yscrollcommand=self.scrollbar.set,
             font=("Courier", 10) # Use a monospace font for alignment
         )
         self.text_area.pack(fill="both", expand=True)
         
-        scrollbar.config(command=self.text_area.yview)
+        self.scrollbar.config(command=self.text_area.yview)
         
         # Disable editing
         self.text_area.config(state="disabled")
@@ -396,22 +426,26 @@ class AllAccountsPage(ttk.Frame):
 
     def on_show(self):
         """Called when the frame is raised. Refreshes the account list."""
-        self.text_area.config(state="normal") # Enable editing to insert text
+        # Enable editing and detach the scrollbar while the text is replaced
+        self.text_area.config(state="normal", yscrollcommand="")
         self.text_area.delete(1.0, "end") # Clear old content
         
-        all_accounts = self.controller.bank.accounts
+        bank = self.controller.bank
         
-        if not all_accounts:
+        if not len(bank):
             self.text_area.insert("end", "No accounts in the bank.")
         else:
-            for acc_num, account in all_accounts.items():
-                self.text_area.insert("end", f"Account Number: {account.account_number}\n")
-                self.text_area.insert("end", f"Holder Name: {account.name}\n")
-                self.text_area.insert("end", f"Account Type: {account.account_type}\n")
-                self.text_area.insert("end", f"Balance: ${account.balance:.2f}\n")
-                self.text_area.insert("end", "--------------------------------------\n")
+            # Build the whole listing first so the widget is updated only once
+            parts = []
+            append = parts.append
+            for account in bank:
+                append(str(account)[1:]) # Drop the details' leading newline
+                append("\n--------------------------------------\n")
+            self.text_area.insert("end", "".join(parts))
                 
-        self.text_area.config(state="disabled") # Disable editing again
+        # Disable editing again and resync the scrollbar once
+        self.text_area.config(state="disabled", yscrollcommand=self.scrollbar.set)
+        self.scrollbar.set(*self.text_area.yview())
 
 # --- Page 8: Close Account ---
 
@@ -428,7 +462,7 @@ class CloseAccountPage(BasePage):
         
     def on_close(self):
         try:
-            acc_num = int(self.acc_num_entry.get())
+            acc_num = self._parse_acc()
             
             # --- Add a confirmation dialog ---
             account = self.controller.bank.find_account(acc_num)
@@ -445,7 +479,7 @@ class CloseAccountPage(BasePage):
                 if self.controller.bank.close_account(acc_num):
                     messagebox.showinfo("Success", f"Account {acc_num} has been closed.")
                     self.acc_num_entry.delete(0, 'end')
-                    self.controller.show_frame("StartPage")
+                    self.controller.show_frame(Page.START)
                 else:
                     # This case should be covered by find_account, but good to have
                     messagebox.showerror("Error", "Account not found.")